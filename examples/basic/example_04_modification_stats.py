@@ -2,11 +2,17 @@
 """List per-file modification stats for each commit.
 
 This example traverses commits and prints a table of file paths with
-added/removed line counts for each commit.
+added/removed line counts for each commit. With ``--memory-budget`` rows are
+spilled to a file on disk whenever the buffer grows past the budget and the
+table is streamed back from it, so large histories do not need to fit in
+memory.
 """
 
 import argparse
+import json
 import sys
+import tempfile
+from collections.abc import Iterable
 from pathlib import Path
 
 
@@ -52,6 +58,12 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Limit the number of commits processed.",
     )
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        default=None,
+        help="Approximate memory budget in MB before spilling to disk.",
+    )
     if len(sys.argv) == 1:
         parser.print_help()
         parser.exit()
@@ -61,10 +73,77 @@ def parse_args() -> argparse.Namespace:
     return args
 
 
+def row_size(row: list[str | int]) -> int:
+    """Estimate the memory held by one buffered row."""
+    return sum(sys.getsizeof(value) + 8 for value in row)
+
+
+def print_table(rows: Iterable[list[str | int]], columns: list[str],
+                widths: list[int]) -> None:
+    """Print rows right-aligned like pandas' to_string(index=False)."""
+    print(" ".join(name.rjust(width) for name, width in zip(columns, widths)))
+    for row in rows:
+        print(" ".join(str(value).rjust(width)
+                       for value, width in zip(row, widths)))
+
+
+def spill_main(args: argparse.Namespace) -> None:
+    """Collect modification stats within a memory budget using a spill file."""
+    from pydriller import Repository
+
+    budget = int(args.memory_budget * 1024 * 1024)
+    columns = ["hash", "file", "added", "removed"]
+    # pandas pads numeric headers with a space reserved for the sign.
+    widths = [len("hash"), len("file"), len(" added"), len(" removed")]
+    rows: list[list[str | int]] = []
+    used = 0
+    count = 0
+    total = 0
+
+    with tempfile.TemporaryDirectory(prefix="modification_stats_") as tmp:
+        spill_path = Path(tmp) / "rows.jsonl"
+        with spill_path.open("w", encoding="utf-8") as handle:
+            # Traverse commits and flush the buffered rows when over budget.
+            for commit in Repository(str(args.repo)).traverse_commits():
+                for modification in commit.modified_files:
+                    file_path = modification.new_path or modification.old_path or "<deleted>"
+                    row = [commit.hash[:7], file_path,
+                           modification.added_lines, modification.deleted_lines]
+                    widths = [max(width, len(str(value)))
+                              for width, value in zip(widths, row)]
+                    rows.append(row)
+                    used += row_size(row)
+
+                if used >= budget:
+                    handle.writelines(json.dumps(row) + "\n" for row in rows)
+                    total += len(rows)
+                    rows.clear()
+                    used = 0
+
+                count += 1
+                # Optional early-exit for faster exploration.
+                if args.max_count is not None and count >= args.max_count:
+                    break
+
+            handle.writelines(json.dumps(row) + "\n" for row in rows)
+            total += len(rows)
+            rows.clear()
+
+        # Stream the rows back from disk in their original order.
+        if total:
+            with spill_path.open(encoding="utf-8") as handle:
+                print_table((json.loads(line) for line in handle),
+                            columns, widths)
+
+
 def main() -> None:
     """Run the modification stats example and print a formatted table."""
     args = parse_args()
 
+    if args.memory_budget is not None:
+        spill_main(args)
+        return
+
     import pandas as pd
     from pydriller import Repository
     rows: list[dict[str, str | int]] = []
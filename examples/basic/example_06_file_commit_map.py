@@ -2,13 +2,24 @@
 """Build a map of files to the commits that modified them.
 
 This example groups commit hashes by file path to show change history per file.
+With ``--memory-budget`` the partial map is spilled to sorted run files on disk
+whenever it grows past the budget, and the runs are k-way merged into the same
+path-sorted table, so very large repositories do not need to fit in memory.
 """
 
 import argparse
+import heapq
+import json
 import sys
+import tempfile
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from itertools import groupby
 from pathlib import Path
 
+# Upper bound on run files opened at once during the k-way merge.
+MAX_OPEN_RUNS = 64
+
 
 def validate_repo_path(repo: Path, parser: argparse.ArgumentParser) -> None:
     """Validate that repo exists, is a directory, and is a Git repository."""
@@ -45,6 +56,12 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help="Path or URL to the repository to traverse.",
     )
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        default=None,
+        help="Approximate memory budget in MB before spilling to disk.",
+    )
     if len(sys.argv) == 1:
         parser.print_help()
         parser.exit()
@@ -54,10 +71,137 @@ def parse_args() -> argparse.Namespace:
     return args
 
 
+def entry_size(*values: str) -> int:
+    """Estimate the memory held by the strings of one map entry."""
+    return sum(sys.getsizeof(value) + 8 for value in values)
+
+
+def write_run(file_to_commits: dict[str, list[str]], run_dir: Path,
+              run_number: int) -> Path:
+    """Write the partial map to a path-sorted run file and return its path."""
+    run_path = run_dir / f"run_{run_number:06d}.jsonl"
+    with run_path.open("w", encoding="utf-8") as handle:
+        for file_path, hashes in sorted(file_to_commits.items()):
+            handle.write(json.dumps([file_path, hashes]) + "\n")
+    return run_path
+
+
+def read_run(run_path: Path) -> Iterator[tuple[str, list[str]]]:
+    """Yield (file_path, hashes) pairs from a run file in stored order."""
+    with run_path.open(encoding="utf-8") as handle:
+        for line in handle:
+            file_path, hashes = json.loads(line)
+            yield file_path, hashes
+
+
+def merge_runs(run_paths: list[Path]) -> Iterator[tuple[str, list[str]]]:
+    """K-way merge run files, joining the histories of equal paths.
+
+    Runs are written in traversal order and heapq.merge keeps equal keys in
+    input order, so each path's hashes stay in commit order.
+    """
+    merged = heapq.merge(*(read_run(run_path) for run_path in run_paths),
+                         key=lambda item: item[0])
+    for file_path, group in groupby(merged, key=lambda item: item[0]):
+        hashes: list[str] = []
+        for _, run_hashes in group:
+            hashes.extend(run_hashes)
+        yield file_path, hashes
+
+
+def reduce_runs(run_paths: list[Path], run_dir: Path) -> list[Path]:
+    """Merge runs level by level until they can all be opened at once.
+
+    Each pass merges consecutive groups of runs, so runs stay in traversal
+    order and every entry is rewritten only about log(runs) times.
+    """
+    run_number = len(run_paths)
+    while len(run_paths) > MAX_OPEN_RUNS:
+        next_level: list[Path] = []
+        for start in range(0, len(run_paths), MAX_OPEN_RUNS):
+            batch = run_paths[start:start + MAX_OPEN_RUNS]
+            if len(batch) == 1:
+                next_level.append(batch[0])
+                continue
+
+            merged_path = run_dir / f"run_{run_number:06d}.jsonl"
+            with merged_path.open("w", encoding="utf-8") as handle:
+                for file_path, hashes in merge_runs(batch):
+                    handle.write(json.dumps([file_path, hashes]) + "\n")
+            for run_path in batch:
+                run_path.unlink()
+            next_level.append(merged_path)
+            run_number += 1
+        run_paths = next_level
+    return run_paths
+
+
+def print_table(rows: Iterable[list[str]], columns: list[str],
+                widths: list[int]) -> None:
+    """Print rows right-aligned like pandas' to_string(index=False)."""
+    print(" ".join(name.rjust(width) for name, width in zip(columns, widths)))
+    for row in rows:
+        print(" ".join(value.rjust(width) for value, width in zip(row, widths)))
+
+
+def spill_main(args: argparse.Namespace) -> None:
+    """Build the file/commit map within a memory budget using run files."""
+    from pydriller import Repository
+
+    budget = int(args.memory_budget * 1024 * 1024)
+    columns = ["file", "commits"]
+
+    with tempfile.TemporaryDirectory(prefix="file_commit_map_") as tmp:
+        run_dir = Path(tmp)
+        run_paths: list[Path] = []
+        file_to_commits: dict[str, list[str]] = defaultdict(list)
+        used = 0
+
+        # Traverse commits and spill the partial map whenever it is too big.
+        for commit in Repository(str(args.repo)).traverse_commits():
+            short_hash = commit.hash[:7]
+            for modification in commit.modified_files:
+                file_path = modification.new_path or modification.old_path or "<deleted>"
+                if file_path not in file_to_commits:
+                    used += entry_size(file_path)
+                file_to_commits[file_path].append(short_hash)
+                used += entry_size(short_hash)
+
+            if used >= budget:
+                run_paths.append(
+                    write_run(file_to_commits, run_dir, len(run_paths)))
+                file_to_commits.clear()
+                used = 0
+
+        if file_to_commits:
+            run_paths.append(write_run(file_to_commits, run_dir, len(run_paths)))
+            file_to_commits.clear()
+
+        if not run_paths:
+            return
+
+        # Merge the runs into one table file, tracking the column widths.
+        widths = [len(name) for name in columns]
+        table_path = run_dir / "table.jsonl"
+        with table_path.open("w", encoding="utf-8") as handle:
+            for file_path, hashes in merge_runs(reduce_runs(run_paths, run_dir)):
+                row = [file_path, ", ".join(hashes)]
+                widths = [max(width, len(value))
+                          for width, value in zip(widths, row)]
+                handle.write(json.dumps(row) + "\n")
+
+        with table_path.open(encoding="utf-8") as handle:
+            print_table((json.loads(line) for line in handle), columns, widths)
+
+
 def main() -> None:
     """Run the file commit map example and print a formatted table."""
     args = parse_args()
 
+    if args.memory_budget is not None:
+        spill_main(args)
+        return
+
     import pandas as pd
     from pydriller import Repository
     file_to_commits: dict[str, list[str]] = defaultdict(list)
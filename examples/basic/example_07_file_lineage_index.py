@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""Build a rename-aware lineage index of files and query their history.
+
+This example follows ``old_path`` -> ``new_path`` renames during traversal and
+groups every path a file has had into a single lineage. The index is saved as
+JSON so the full history of a file across renames becomes one dictionary
+lookup, and later runs only traverse the commits added since the last one.
+
+Commits are replayed in topological order so every parent is applied before
+its children. Merge commits carry no modifications in PyDriller, so if one
+branch renames a file while another branch edits the old path, the edit starts
+a separate lineage under the old name and ``--file <old name>`` returns that
+lineage instead of the renamed one.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+INDEX_VERSION = 1
+
+
+def validate_repo_path(repo: Path, parser: argparse.ArgumentParser) -> None:
+    """Validate that repo exists, is a directory, and is a Git repository."""
+    if not repo.exists():
+        parser.error(f"Repository path does not exist: {repo}")
+
+    if not repo.is_dir():
+        parser.error(f"Repository path is not a directory: {repo}")
+
+    result = subprocess.run(
+        ["git", "-C", str(repo), "rev-parse", "--is-inside-work-tree"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0 or result.stdout.strip() != "true":
+        parser.error(f"Repository path is not a valid Git repository: {repo}")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments for the file lineage example.
+
+    Returns:
+        Parsed arguments containing the repository location, index path and
+        optional file to look up.
+    """
+    # Configure the CLI and return parsed arguments.
+    parser = argparse.ArgumentParser(
+        description="Group files into rename-aware lineages and show history.",
+    )
+    parser.add_argument(
+        "repo",
+        type=Path,
+        help="Path to the local Git repository to traverse.",
+    )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        default=Path("file_lineage.json"),
+        help="JSON file used to persist the lineage index.",
+    )
+    parser.add_argument(
+        "--file",
+        default=None,
+        help="Show the full history of this path across renames.",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Rebuild the index from scratch and check it matches the saved one.",
+    )
+    if len(sys.argv) == 1:
+        parser.print_help()
+        parser.exit()
+
+    args = parser.parse_args()
+    validate_repo_path(args.repo, parser)
+    return args
+
+
+def git_head(repo: Path) -> str | None:
+    """Return the full hash of HEAD, or None for a repository without commits."""
+    result = subprocess.run(
+        ["git", "-C", str(repo), "rev-parse", "--verify", "-q", "HEAD"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return result.stdout.strip() or None
+
+
+def is_ancestor(repo: Path, commit: str, head: str) -> bool:
+    """Return True if commit is reachable from head."""
+    result = subprocess.run(
+        ["git", "-C", str(repo), "merge-base", "--is-ancestor", commit, head],
+        capture_output=True,
+        check=False,
+    )
+    return result.returncode == 0
+
+
+def new_commits(repo: Path, last: str, head: str) -> list[str]:
+    """Return the commits reachable from head but not from last.
+
+    Parents are always listed before their children.
+    """
+    result = subprocess.run(
+        ["git", "-C", str(repo), "rev-list", "--topo-order", "--reverse",
+         f"{last}..{head}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.split()
+
+
+def empty_index() -> dict:
+    """Return an index with no processed commits.
+
+    ``lineages`` holds one entry per file lineage (its id is the list
+    position), ``live`` maps each path that currently exists to its lineage
+    and ``paths`` maps every path ever seen to the lineages that used it.
+    """
+    return {
+        "version": INDEX_VERSION,
+        "head": None,
+        "lineages": [],
+        "live": {},
+        "paths": {},
+    }
+
+
+def load_index(path: Path) -> dict:
+    """Load a saved index, or return an empty one if it is missing or stale."""
+    if not path.exists():
+        return empty_index()
+
+    with path.open(encoding="utf-8") as handle:
+        index = json.load(handle)
+    if index.get("version") != INDEX_VERSION:
+        return empty_index()
+    return index
+
+
+def save_index(index: dict, path: Path) -> None:
+    """Write the index next to its final location and move it into place."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as handle:
+        json.dump(index, handle)
+    tmp_path.replace(path)
+
+
+def new_lineage(index: dict) -> int:
+    """Create an empty lineage and return its id."""
+    index["lineages"].append({"paths": [], "commits": []})
+    return len(index["lineages"]) - 1
+
+
+def add_path(index: dict, lineage_id: int, file_path: str) -> None:
+    """Record that lineage_id is known under file_path."""
+    lineage = index["lineages"][lineage_id]
+    if not lineage["paths"] or lineage["paths"][-1] != file_path:
+        lineage["paths"].append(file_path)
+
+    users = index["paths"].setdefault(file_path, [])
+    if not users or users[-1] != lineage_id:
+        users.append(lineage_id)
+
+
+def apply_commit(index: dict, commit) -> None:
+    """Assign each modification of commit to a lineage, following renames."""
+    short_hash = commit.hash[:7]
+    live: dict[str, int] = index["live"]
+
+    for modification in commit.modified_files:
+        old_path = modification.old_path
+        new_path = modification.new_path
+
+        # Renames keep the lineage of the old path and deletions retire it.
+        # Added and copied files always start a lineage of their own.
+        lineage_id = None
+        if old_path and modification.change_type.name != "COPY":
+            lineage_id = live.pop(old_path, None)
+        if lineage_id is None:
+            lineage_id = new_lineage(index)
+            if modification.change_type.name == "COPY":
+                old_path = None
+
+        if old_path and not index["lineages"][lineage_id]["paths"]:
+            add_path(index, lineage_id, old_path)
+        if new_path:
+            add_path(index, lineage_id, new_path)
+            live[new_path] = lineage_id
+
+        commits = index["lineages"][lineage_id]["commits"]
+        if not commits or commits[-1] != short_hash:
+            commits.append(short_hash)
+
+
+def update_index(index: dict, repo: Path) -> dict:
+    """Bring the index up to date with the repository's HEAD.
+
+    Only commits after the last indexed one are traversed. If the recorded
+    commit is no longer an ancestor of HEAD (e.g. after a force-push) the
+    index is rebuilt from scratch.
+    """
+    from pydriller import Git, Repository
+
+    head = git_head(repo)
+    if head is None or head == index["head"]:
+        return index
+
+    last = index["head"]
+    if last is not None and not is_ancestor(repo, last, head):
+        index = empty_index()
+        last = None
+
+    if last is None:
+        # Topological order applies each rename after the commits before it.
+        for commit in Repository(str(repo), order="topo-order").traverse_commits():
+            apply_commit(index, commit)
+    else:
+        # Unlike from_commit, last..head also covers commits merged in from
+        # branches that forked before the indexed commit.
+        git = Git(str(repo))
+        try:
+            for commit_hash in new_commits(repo, last, head):
+                apply_commit(index, git.get_commit(commit_hash))
+        finally:
+            git.clear()
+
+    index["head"] = head
+    return index
+
+
+def lookup(index: dict, file_path: str) -> int | None:
+    """Return the lineage id for file_path, preferring the live file."""
+    if file_path in index["live"]:
+        return index["live"][file_path]
+
+    users = index["paths"].get(file_path)
+    return users[-1] if users else None
+
+
+def canonical(index: dict) -> tuple:
+    """Return the index contents independent of lineage numbering.
+
+    Branches may be interleaved differently by a full rebuild and by a series
+    of incremental updates, which changes lineage ids and commit order but not
+    which paths and commits belong together.
+    """
+    keys = [
+        (tuple(lineage["paths"]), tuple(sorted(lineage["commits"])))
+        for lineage in index["lineages"]
+    ]
+    live = {file_path: keys[lineage_id]
+            for file_path, lineage_id in index["live"].items()}
+    return index["head"], sorted(keys), live
+
+
+def main() -> None:
+    """Run the file lineage example and print a formatted table."""
+    args = parse_args()
+
+    import pandas as pd
+
+    index = update_index(load_index(args.index), args.repo)
+    save_index(index, args.index)
+
+    # The index must not depend on how many runs it took to build it.
+    if args.verify:
+        if canonical(update_index(empty_index(), args.repo)) != canonical(index):
+            sys.exit(f"Index {args.index} differs from a full rebuild")
+        print(f"Index {args.index} matches a full rebuild")
+
+    # A single lookup answers "full history of X" across all of its names.
+    if args.file is not None:
+        lineage_id = lookup(index, args.file)
+        if lineage_id is None:
+            print(f"No history found for {args.file}")
+            return
+        selected = [lineage_id]
+    else:
+        selected = range(len(index["lineages"]))
+
+    rows: list[dict[str, str | int]] = []
+    for lineage_id in selected:
+        lineage = index["lineages"][lineage_id]
+        rows.append(
+            {
+                "lineage": lineage_id,
+                "paths": " -> ".join(lineage["paths"]),
+                "commits": ", ".join(lineage["commits"]),
+            }
+        )
+
+    # Render the lineages using pandas for aligned output.
+    if rows:
+        table = pd.DataFrame(rows, columns=["lineage", "paths", "commits"])
+        print(table.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
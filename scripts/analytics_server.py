@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+"""Serve repository analytics from warm in-memory indexes over HTTP.
+
+This script traverses each repository once at startup and keeps the results in
+memory. Requests check whether HEAD moved (at most once per refresh interval)
+and, if so, a background thread reads only the new commits while requests keep
+getting the last good data. Results are kept in the order a fresh traversal
+returns them, whatever the refresh history. The queries mirror the
+``examples/basic`` scripts and are returned as paginated JSON:
+
+    GET /repos
+    GET /repos/<name>/overview
+    GET /repos/<name>/commits-by-date?days=30
+    GET /repos/<name>/commits-by-author?email=<author email>
+    GET /repos/<name>/modification-stats
+    GET /repos/<name>/file-map?path=<file path>
+
+All list endpoints accept ``offset`` and ``limit`` query parameters.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from operator import itemgetter
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+# Keeps "now - days" well inside the range datetime can represent.
+MAX_DAYS = 100_000
+
+# Rows of a query result and the function that turns one row into an item.
+Query = tuple[Sequence, Callable[[object], dict]]
+
+
+class QueryError(Exception):
+    """Raised for requests that cannot be answered, with an HTTP status."""
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def validate_repo_path(repo: Path, parser: argparse.ArgumentParser) -> None:
+    """Validate that repo exists, is a directory, and is a Git repository."""
+    if not repo.exists():
+        parser.error(f"Repository path does not exist: {repo}")
+
+    if not repo.is_dir():
+        parser.error(f"Repository path is not a directory: {repo}")
+
+    result = subprocess.run(
+        ["git", "-C", str(repo), "rev-parse", "--is-inside-work-tree"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0 or result.stdout.strip() != "true":
+        parser.error(f"Repository path is not a valid Git repository: {repo}")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments for the analytics server.
+
+    Returns:
+        Parsed arguments containing the repositories to serve and the
+        listening address.
+    """
+    # Configure the CLI and return parsed arguments.
+    parser = argparse.ArgumentParser(
+        description="Serve commit analytics for local repositories as JSON.",
+    )
+    parser.add_argument(
+        "repos",
+        type=Path,
+        nargs="+",
+        help="Paths to the local Git repositories to serve.",
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address to listen on.",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="Port to listen on.",
+    )
+    parser.add_argument(
+        "--refresh-interval",
+        type=float,
+        default=2.0,
+        help="Seconds between checks for a moved HEAD.",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="After each refresh, compare the index with a fresh build.",
+    )
+    if len(sys.argv) == 1:
+        parser.print_help()
+        parser.exit()
+
+    args = parser.parse_args()
+    for repo in args.repos:
+        validate_repo_path(repo, parser)
+
+    names = [repo.resolve().name for repo in args.repos]
+    if len(set(names)) != len(names):
+        parser.error("Repository directory names must be unique.")
+    return args
+
+
+def git_head(repo: Path) -> str | None:
+    """Return the full hash of HEAD, or None for a repository without commits."""
+    result = subprocess.run(
+        ["git", "-C", str(repo), "rev-parse", "--verify", "-q", "HEAD"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return result.stdout.strip() or None
+
+
+def traversal_order(repo: Path, head: str) -> list[str]:
+    """Return the commits reachable from head, oldest first.
+
+    This is the order PyDriller's default traversal uses, so an index built
+    from it does not depend on how many refreshes it took to build.
+    """
+    result = subprocess.run(
+        ["git", "-C", str(repo), "rev-list", "--reverse", head],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.split()
+
+
+class RepoIndex:
+    """Commit, modification and file data of one repository, kept warm.
+
+    Queries read the current views under ``lock``. Refreshes run in a
+    background thread under ``refresh_lock``: they read new commits from Git
+    and rebuild the views without blocking queries, then take ``lock`` only
+    to swap the new views in. Until then requests get the last good data.
+    """
+
+    def __init__(self, repo: Path, refresh_interval: float,
+                 verify: bool = False) -> None:
+        self.repo = repo
+        self.name = repo.resolve().name
+        self.refresh_interval = refresh_interval
+        self.verify = verify
+        self.lock = threading.Lock()
+        self.refresh_lock = threading.Lock()
+        self.checked_at = float("-inf")
+        # Commit records by full hash; only touched under refresh_lock.
+        self.records: dict[str, dict] = {}
+        self.head: str | None = None
+        self.swap(None, [])
+
+    def swap(self, head: str | None, records: list[dict]) -> None:
+        """Build the query views from records in order and make them current."""
+        commits: list[dict] = []
+        modifications: list[dict[str, str | int]] = []
+        by_email: dict[str, list[int]] = defaultdict(list)
+        file_to_commits: dict[str, list[str]] = defaultdict(list)
+
+        for record in records:
+            for modification in record["modifications"]:
+                file_to_commits[modification["file"]].append(record["hash"])
+                modifications.append(modification)
+
+            by_email[record["email"]].append(len(commits))
+            commits.append(
+                {
+                    "hash": record["hash"],
+                    "author": record["author"],
+                    "message": record["message"],
+                    "date": record["date"],
+                    "files": [modification["file"]
+                              for modification in record["modifications"]],
+                }
+            )
+
+        with self.lock:
+            self.head = head
+            self.commits = commits
+            self.modifications = modifications
+            self.by_email = by_email
+            self.file_to_commits = file_to_commits
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop the sorted views, which are rebuilt on first use."""
+        self.sorted_files: list[str] | None = None
+        self.sorted_authors: list[str] | None = None
+        self.date_order: list[tuple[datetime, int]] | None = None
+
+    def schedule_refresh(self) -> None:
+        """Start a background refresh if the refresh interval has passed."""
+        if time.monotonic() - self.checked_at < self.refresh_interval:
+            return
+        if self.refresh_lock.locked():
+            return
+        threading.Thread(target=self.background_refresh, daemon=True).start()
+
+    def background_refresh(self) -> None:
+        """Run refresh and report failures instead of raising them."""
+        try:
+            self.refresh()
+        except Exception as error:  # noqa: BLE001 - keep the last good data
+            print(f"Refreshing {self.name} failed: "
+                  f"{type(error).__name__}: {error}", file=sys.stderr)
+
+    def refresh(self) -> None:
+        """Index the commits that are new since the last refresh.
+
+        HEAD is checked at most once per refresh interval, also after a
+        failure. Only commits missing from the record store are read from
+        Git, and the views are rebuilt in full traversal order, so commits
+        merged in from side branches land where a fresh build puts them.
+        After a force-push unreachable commits are dropped.
+        """
+        if not self.refresh_lock.acquire(blocking=False):
+            return
+        try:
+            now = time.monotonic()
+            if now - self.checked_at < self.refresh_interval:
+                return
+            self.checked_at = now
+
+            head = git_head(self.repo)
+            if head is None or head == self.head:
+                return
+
+            order = traversal_order(self.repo, head)
+            missing = [commit_id for commit_id in order
+                       if commit_id not in self.records]
+            new_records = self.read_commits(missing, full=not self.records)
+
+            self.records = {
+                commit_id: self.records.get(commit_id) or new_records[commit_id]
+                for commit_id in order
+            }
+            self.swap(head, list(self.records.values()))
+
+            if self.verify:
+                self.check_against_fresh_build(head)
+        finally:
+            self.refresh_lock.release()
+
+    def read_commits(self, commit_ids: list[str], full: bool) -> dict[str, dict]:
+        """Read commit records for commit_ids, keyed by full hash."""
+        from pydriller import Git, Repository
+
+        if full:
+            return {
+                commit.hash: commit_record(commit)
+                for commit in Repository(str(self.repo)).traverse_commits()
+            }
+
+        git = Git(str(self.repo))
+        try:
+            return {
+                commit_id: commit_record(git.get_commit(commit_id))
+                for commit_id in commit_ids
+            }
+        finally:
+            git.clear()
+
+    def check_against_fresh_build(self, head: str) -> None:
+        """Compare the records with a fresh traversal and report the result."""
+        from pydriller import Repository
+
+        fresh = [
+            commit_record(commit)
+            for commit in Repository(str(self.repo), to_commit=head)
+            .traverse_commits()
+        ]
+        verdict = ("matches" if fresh == list(self.records.values())
+                   else "differs from")
+        print(f"Index of {self.name} at {head[:7]} {verdict} a fresh build",
+              file=sys.stderr, flush=True)
+
+    def overview(self, params: dict[str, str]) -> Query:
+        """Return hash, author and message for every commit."""
+        return self.commits, partial(project, keys=("hash", "author", "message"))
+
+    def commits_by_date(self, params: dict[str, str]) -> Query:
+        """Return commits from the last ``days`` days (default: 30)."""
+        days = int_param(params, "days", 30, maximum=MAX_DAYS)
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+
+        if self.date_order is None:
+            self.date_order = sorted(
+                (commit["date"], position)
+                for position, commit in enumerate(self.commits)
+            )
+        start = bisect_left(self.date_order, since, key=itemgetter(0))
+        # Keep traversal order, like the by-date example.
+        positions = sorted(position for _, position in self.date_order[start:])
+
+        def by_date(position: int) -> dict:
+            commit = self.commits[position]
+            return {
+                "hash": commit["hash"],
+                "date": commit["date"].strftime("%Y/%m/%d %H:%M:%S"),
+            }
+
+        return positions, by_date
+
+    def commits_by_author(self, params: dict[str, str]) -> Query:
+        """Return the commits of ``email``, or all authors if it is missing."""
+        email = params.get("email")
+        if not email:
+            if self.sorted_authors is None:
+                self.sorted_authors = sorted(
+                    {commit["author"] for commit in self.commits})
+            return self.sorted_authors, lambda author: {"author": author}
+
+        return self.by_email.get(email, []), lambda position: project(
+            self.commits[position], keys=("hash", "author", "files"))
+
+    def modification_stats(self, params: dict[str, str]) -> Query:
+        """Return added/removed line counts per file and commit."""
+        return self.modifications, dict
+
+    def file_map(self, params: dict[str, str]) -> Query:
+        """Return path-sorted files with their commits, or a single ``path``."""
+        file_path = params.get("path")
+        if file_path is not None:
+            files = [file_path] if file_path in self.file_to_commits else []
+        else:
+            if self.sorted_files is None:
+                self.sorted_files = sorted(self.file_to_commits)
+            files = self.sorted_files
+
+        return files, lambda name: {
+            "file": name, "commits": self.file_to_commits[name]}
+
+
+QUERIES = {
+    "overview": RepoIndex.overview,
+    "commits-by-date": RepoIndex.commits_by_date,
+    "commits-by-author": RepoIndex.commits_by_author,
+    "modification-stats": RepoIndex.modification_stats,
+    "file-map": RepoIndex.file_map,
+}
+
+
+def commit_record(commit) -> dict:
+    """Read everything the indexes need from one PyDriller commit."""
+    short_hash = commit.hash[:7]
+    return {
+        "hash": short_hash,
+        "author": f"{commit.author.name} <{commit.author.email}>",
+        "email": commit.author.email,
+        "message": commit.msg.strip(),
+        "date": commit.committer_date,
+        "modifications": [
+            {
+                "hash": short_hash,
+                "file": modification.new_path or modification.old_path or "<deleted>",
+                "added": modification.added_lines,
+                "removed": modification.deleted_lines,
+            }
+            for modification in commit.modified_files
+        ],
+    }
+
+
+def project(record: dict, keys: tuple[str, ...]) -> dict:
+    """Return the given keys of an indexed record."""
+    return {key: record[key] for key in keys}
+
+
+def int_param(params: dict[str, str], name: str, default: int,
+              maximum: int | None = None) -> int:
+    """Read a non-negative integer query parameter, at most maximum."""
+    value = params.get(name)
+    if value is None:
+        return default
+    # isdigit() also accepts characters such as "²" that int() rejects.
+    if not value.isdecimal():
+        raise QueryError(HTTPStatus.BAD_REQUEST,
+                         f"{name} must be a non-negative integer")
+    if maximum is not None and int(value) > maximum:
+        raise QueryError(HTTPStatus.BAD_REQUEST,
+                         f"{name} must be at most {maximum}")
+    return int(value)
+
+
+def paginate(query: Query, params: dict[str, str]) -> dict:
+    """Slice a query according to the offset and limit parameters.
+
+    Only the rows on the requested page are turned into response items.
+    """
+    rows, to_item = query
+    offset = int_param(params, "offset", 0)
+    limit = min(int_param(params, "limit", DEFAULT_LIMIT), MAX_LIMIT)
+    return {
+        "total": len(rows),
+        "offset": offset,
+        "limit": limit,
+        "items": [to_item(row) for row in rows[offset:offset + limit]],
+    }
+
+
+class AnalyticsServer(ThreadingHTTPServer):
+    """HTTP server with a listen backlog sized for concurrent dashboards.
+
+    socketserver's default backlog of 5 overflows under a handful of
+    concurrent clients, and overflowing connections wait for a SYN
+    retransmit (about one second) before they are accepted.
+    """
+
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class AnalyticsHandler(BaseHTTPRequestHandler):
+    """Route GET requests to the repository indexes."""
+
+    # Keep-alive lets clients reuse a connection across requests.
+    protocol_version = "HTTP/1.1"
+    indexes: dict[str, RepoIndex] = {}
+
+    def do_GET(self) -> None:
+        """Answer a query with JSON, or a JSON error message."""
+        try:
+            status, body = HTTPStatus.OK, self.handle_query()
+        except QueryError as error:
+            status, body = error.status, {"error": str(error)}
+        except Exception as error:  # noqa: BLE001 - report, keep serving
+            status = HTTPStatus.INTERNAL_SERVER_ERROR
+            body = {"error": f"{type(error).__name__}: {error}"}
+
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def handle_query(self) -> dict:
+        """Resolve the request path to a repository query and run it."""
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        parts = [unquote(part) for part in url.path.strip("/").split("/")]
+
+        if parts == ["repos"]:
+            return {"repos": sorted(self.indexes)}
+
+        if len(parts) != 3 or parts[0] != "repos":
+            raise QueryError(HTTPStatus.NOT_FOUND, f"Unknown path: {url.path}")
+
+        _, name, query = parts
+        index = self.indexes.get(name)
+        if index is None:
+            raise QueryError(HTTPStatus.NOT_FOUND, f"Unknown repository: {name}")
+        if query not in QUERIES:
+            raise QueryError(HTTPStatus.NOT_FOUND, f"Unknown query: {query}")
+
+        index.schedule_refresh()
+        with index.lock:
+            result = paginate(QUERIES[query](index, params), params)
+            result["repo"] = name
+            result["head"] = index.head
+        return result
+
+    def log_message(self, format: str, *args) -> None:
+        """Skip per-request logging to keep the hot path cheap."""
+
+
+def main() -> None:
+    """Index the repositories and serve queries until interrupted."""
+    args = parse_args()
+
+    # Build every index up front so the first requests are already warm.
+    indexes: dict[str, RepoIndex] = {}
+    for repo in args.repos:
+        index = RepoIndex(repo, args.refresh_interval, verify=args.verify)
+        index.refresh()
+        indexes[index.name] = index
+        print(f"Indexed {index.name}: {len(index.commits)} commits")
+
+    AnalyticsHandler.indexes = indexes
+    server = AnalyticsServer((args.host, args.port), AnalyticsHandler)
+    print(f"Serving on http://{args.host}:{server.server_port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Measure request latency of the analytics server against a local repository.
+
+This script starts ``analytics_server.py`` for one repository on a free port,
+waits until it answers, sends a fixed number of requests to each query with a
+pool of concurrent clients and prints the p50/p99 latency per endpoint.
+Latencies are taken from successful responses only; requests that fail or
+answer with another status than 200 are counted as errors.
+"""
+
+import argparse
+import json
+import math
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote
+from urllib.request import urlopen
+
+SERVER_SCRIPT = Path(__file__).with_name("analytics_server.py")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments for the load test.
+
+    Returns:
+        Parsed arguments containing the repository location and load shape.
+    """
+    # Configure the CLI and return parsed arguments.
+    parser = argparse.ArgumentParser(
+        description="Report p50/p99 latency of the analytics server.",
+    )
+    parser.add_argument(
+        "repo",
+        type=Path,
+        help="Path to the local Git repository to serve.",
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=200,
+        help="Number of requests sent to each endpoint.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Number of concurrent client threads.",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=100,
+        help="Page size requested from list endpoints.",
+    )
+    if len(sys.argv) == 1:
+        parser.print_help()
+        parser.exit()
+
+    return parser.parse_args()
+
+
+def free_port() -> int:
+    """Return a TCP port on localhost that is currently unused."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(base_url: str, server: subprocess.Popen,
+                     timeout: float = 300.0) -> None:
+    """Poll the server until it answers or exits."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            sys.exit(f"Server exited with status {server.returncode}")
+        try:
+            with urlopen(f"{base_url}/repos", timeout=1):
+                return
+        except (URLError, OSError):
+            time.sleep(0.2)
+    sys.exit("Server did not become ready in time")
+
+
+def fetch(url: str) -> tuple[float, int]:
+    """Request url and return the latency in milliseconds and the status.
+
+    The status is 0 if no HTTP response was received.
+    """
+    start = time.perf_counter()
+    try:
+        with urlopen(url) as response:
+            response.read()
+            status = response.status
+    except HTTPError as error:
+        error.read()
+        status = error.code
+    except (URLError, OSError):
+        status = 0
+    return (time.perf_counter() - start) * 1000, status
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of samples."""
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def endpoint_urls(base_url: str, name: str, limit: int) -> dict[str, str]:
+    """Build one URL per query, using real data for the lookup parameters."""
+    repo_url = f"{base_url}/repos/{name}"
+    with urlopen(f"{repo_url}/commits-by-author?limit=1") as response:
+        authors = json.load(response)["items"]
+    with urlopen(f"{repo_url}/file-map?limit=1") as response:
+        files = json.load(response)["items"]
+
+    # Authors are listed as "Name <email>"; the query takes the email.
+    email = authors[0]["author"].rsplit("<", 1)[-1].rstrip(">") if authors else ""
+    file_path = files[0]["file"] if files else ""
+
+    page = f"limit={limit}"
+    return {
+        "overview": f"{repo_url}/overview?{page}",
+        "commits-by-date": f"{repo_url}/commits-by-date?days=3650&{page}",
+        "commits-by-author":
+            f"{repo_url}/commits-by-author?email={quote(email)}&{page}",
+        "modification-stats": f"{repo_url}/modification-stats?{page}",
+        "file-map": f"{repo_url}/file-map?{page}",
+        "file-map (path)": f"{repo_url}/file-map?path={quote(file_path)}",
+    }
+
+
+def main() -> None:
+    """Start the server, run the load and print latency percentiles."""
+    args = parse_args()
+
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [sys.executable, str(SERVER_SCRIPT), str(args.repo),
+         "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_ready(base_url, server)
+        with urlopen(f"{base_url}/repos") as response:
+            name = json.load(response)["repos"][0]
+
+        print(f"{'endpoint':<20} {'requests':>8} {'errors':>8} "
+              f"{'p50 ms':>8} {'p99 ms':>8}")
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            for endpoint, url in endpoint_urls(base_url, name,
+                                               args.limit).items():
+                results = list(pool.map(fetch, [url] * args.requests))
+                samples = [latency for latency, status in results
+                           if status == 200]
+                errors = len(results) - len(samples)
+                if samples:
+                    p50 = f"{percentile(samples, 50):>8.2f}"
+                    p99 = f"{percentile(samples, 99):>8.2f}"
+                else:
+                    p50 = p99 = f"{'-':>8}"
+                print(f"{endpoint:<20} {len(results):>8} {errors:>8} "
+                      f"{p50} {p99}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()